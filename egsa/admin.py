@@ -10,6 +10,10 @@ class UtilityReadingAdmin(admin.ModelAdmin):
     ordering = ['-reading_date']
     readonly_fields = ['id', 'created_at', 'updated_at']
 
+    def get_queryset(self, request):
+        # Join the user row up front; list_display shows it per row
+        return super().get_queryset(request).select_related('user')
+
 
 @admin.register(UserProfile)
 class UserProfileAdmin(admin.ModelAdmin):
@@ -17,6 +21,9 @@ class UserProfileAdmin(admin.ModelAdmin):
     list_filter = ['department', 'notification_preferences', 'created_at']
     search_fields = ['user__username', 'user__email', 'department']
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('user')
+
 
 @admin.register(UtilityReport)
 class UtilityReportAdmin(admin.ModelAdmin):
@@ -25,3 +32,6 @@ class UtilityReportAdmin(admin.ModelAdmin):
     search_fields = ['user__username', 'report_name']
     ordering = ['-date_generated']
     readonly_fields = ['id', 'date_generated']
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('user')
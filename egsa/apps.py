@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class EgsaConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'egsa'
+
+    def ready(self):
+        # Compile the numerical kernels at startup so no request pays
+        # the Numba JIT cost (no-op when Numba is not installed)
+        from .utils import _kernels
+        _kernels.warmup()
@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('egsa', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='utilityreading',
+            index=models.Index(fields=['user', '-reading_date'], name='egsa_read_user_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='utilityreading',
+            index=models.Index(fields=['user', 'utility_type', 'reading_date'], name='egsa_read_user_type_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='utilityreading',
+            index=models.Index(fields=['reading_date'], name='egsa_read_date_idx'),
+        ),
+    ]
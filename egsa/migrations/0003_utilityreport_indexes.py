@@ -0,0 +1,20 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('egsa', '0002_utilityreading_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='utilityreport',
+            name='date_generated',
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+        migrations.AddIndex(
+            model_name='utilityreport',
+            index=models.Index(fields=['user', '-date_generated'], name='egsa_rep_user_date_idx'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+from django.db import migrations, models
+from django.db.models import F
+
+
+def populate_integer_columns(apps, schema_editor):
+    UtilityReading = apps.get_model('egsa', 'UtilityReading')
+    UtilityReading.objects.update(
+        reading_value_milli=F('reading_value') * 1000,
+        cost_cents=F('cost') * 100,
+    )
+
+
+def noop(apps, schema_editor):
+    pass
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('egsa', '0003_utilityreport_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='utilityreading',
+            name='reading_value_milli',
+            field=models.BigIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='utilityreading',
+            name='cost_cents',
+            field=models.BigIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(populate_integer_columns, noop),
+    ]
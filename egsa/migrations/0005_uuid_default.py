@@ -0,0 +1,22 @@
+import egsa.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('egsa', '0004_utilityreading_integer_columns'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='utilityreading',
+            name='id',
+            field=models.UUIDField(default=egsa.models._uuid4, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='utilityreport',
+            name='id',
+            field=models.UUIDField(default=egsa.models._uuid4, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
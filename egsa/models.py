@@ -1,8 +1,54 @@
 from django.db import models
+from django.db.models import Avg, Count, Sum
 from django.contrib.auth.models import User
 from django.utils import timezone
+from datetime import datetime
+import secrets
 import uuid
 
+
+def _uuid4():
+    """Random v4 UUID built straight from secrets.token_bytes
+
+    Skips uuid.uuid4's extra Python-side bookkeeping, which adds up on
+    bulk inserts and backfills.
+    """
+    return uuid.UUID(bytes=secrets.token_bytes(16), version=4)
+
+class UtilityReadingManager(models.Manager):
+    """Manager that always joins the related user row"""
+    def get_queryset(self):
+        return super().get_queryset().select_related('user')
+
+    def monthly_stats(self, user, year, month):
+        """Per-utility aggregate stats for one calendar month
+
+        Aggregates in the database over a half-open reading_date range so
+        the (user, utility_type, reading_date) index applies, instead of
+        non-sargable month/year lookups.
+        """
+        month_start = timezone.make_aware(datetime(year, month, 1))
+        if month == 12:
+            month_end = timezone.make_aware(datetime(year + 1, 1, 1))
+        else:
+            month_end = timezone.make_aware(datetime(year, month + 1, 1))
+
+        return self.filter(
+            user=user,
+            reading_date__gte=month_start,
+            reading_date__lt=month_end
+        ).values('utility_type').annotate(
+            reading_count=Count('id'),
+            total_usage=Sum('reading_value'),
+            total_cost=Sum('cost'),
+            avg_usage=Avg('reading_value')
+        )
+
+class UtilityReportManager(models.Manager):
+    """Manager that always joins the related user row"""
+    def get_queryset(self):
+        return super().get_queryset().select_related('user')
+
 class UtilityReading(models.Model):
     """Model for storing utility readings"""
     UTILITY_TYPES = [
@@ -12,21 +58,47 @@ class UtilityReading(models.Model):
         ('air_conditioning', 'Air Conditioning'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=_uuid4, editable=False)
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     utility_type = models.CharField(max_length=20, choices=UTILITY_TYPES)
     reading_value = models.DecimalField(max_digits=10, decimal_places=2)
     unit = models.CharField(max_length=10, default='kWh')
     cost = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+    # Integer shadow columns (thousandths / cents) for fast SUM() aggregation;
+    # kept in sync with reading_value and cost on save()
+    reading_value_milli = models.BigIntegerField(null=True, blank=True, editable=False)
+    cost_cents = models.BigIntegerField(null=True, blank=True, editable=False)
     reading_date = models.DateTimeField(default=timezone.now)
     notes = models.TextField(blank=True, null=True)
     location = models.CharField(max_length=100, default='Main Building')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    
+
+    objects = UtilityReadingManager()
+
     class Meta:
         ordering = ['-reading_date']
-        
+        indexes = [
+            models.Index(fields=['user', '-reading_date'], name='egsa_read_user_date_idx'),
+            models.Index(fields=['user', 'utility_type', 'reading_date'], name='egsa_read_user_type_date_idx'),
+            models.Index(fields=['reading_date'], name='egsa_read_date_idx'),
+        ]
+
+    def sync_integer_columns(self):
+        """Derive the integer shadow columns from reading_value and cost
+
+        save() does this automatically; bulk_create skips save(), so
+        batch writers must call it per instance before inserting.
+        """
+        if self.reading_value is not None:
+            self.reading_value_milli = int(self.reading_value * 1000)
+        if self.cost is not None:
+            self.cost_cents = int(self.cost * 100)
+
+    def save(self, *args, **kwargs):
+        self.sync_integer_columns()
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.utility_type} - {self.reading_value} {self.unit}"
 
@@ -39,16 +111,24 @@ class UserProfile(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     
     def __str__(self):
-        return f"{self.user.username} Profile" if self.user else "User Profile"
+        # user is a non-nullable OneToOneField, so no fallback branch needed
+        return f"{self.user.username} Profile"
 
 class UtilityReport(models.Model):
     """Model for storing generated reports"""
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=_uuid4, editable=False)
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     report_name = models.CharField(max_length=200)
     report_type = models.CharField(max_length=50)
-    date_generated = models.DateTimeField(auto_now_add=True)
+    date_generated = models.DateTimeField(auto_now_add=True, db_index=True)
     s3_file_key = models.CharField(max_length=500, blank=True)  # For AWS S3 storage
-    
+
+    objects = UtilityReportManager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', '-date_generated'], name='egsa_rep_user_date_idx'),
+        ]
+
     def __str__(self):
         return f"{self.report_name}"
@@ -0,0 +1,73 @@
+"""
+Numerical kernels for the EGSA calculator library
+
+The scalar utility formulas live here so they can be JIT-compiled with
+Numba when it is installed (Numba cannot compile decimal.Decimal, which
+is why the calculators hand these kernels plain floats). Without Numba
+the plain-Python definitions are used unchanged.
+"""
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _jit(func):
+    """Compile with Numba when available, else return func unchanged"""
+    if njit is None:
+        return func
+    return njit(cache=True, fastmath=True)(func)
+
+
+@_jit
+def heating_cost(cubic_meters, rate, outdoor_temp):
+    """Gas heating cost adjusted for outdoor temperature"""
+    return cubic_meters * rate * max(0.5, (20.0 - outdoor_temp) / 20.0)
+
+
+@_jit
+def cooling_cost(kwh_usage, rate, outdoor_temp):
+    """Air conditioning cost adjusted for outdoor temperature"""
+    return kwh_usage * rate * max(0.8, (outdoor_temp - 70.0) / 30.0 + 1.0)
+
+
+@_jit
+def carbon_footprint(kwh_usage):
+    """CO2 emissions in kg (0.5 kg CO2 per kWh)"""
+    return kwh_usage * 0.5
+
+
+@_jit
+def btu_output(cubic_meters, heating_efficiency):
+    """BTU output from gas consumption (1 cubic meter ~= 35,300 BTU)"""
+    return cubic_meters * 35300.0 * heating_efficiency
+
+
+@_jit
+def condensate_return(steam_usage):
+    """Condensate return (typical 85%)"""
+    return steam_usage * 0.85
+
+
+@_jit
+def heat_transfer(pounds_steam, efficiency_factor):
+    """Heat transfer in BTU (latent heat ~= 970 BTU/lb at 15 PSI)"""
+    return pounds_steam * 970.0 * efficiency_factor
+
+
+@_jit
+def cooling_capacity(kwh_consumption, cop_rating):
+    """Cooling capacity in tons (1 ton = 12,000 BTU/hr, 1 kWh ~= 3,412 BTU)"""
+    return kwh_consumption * 3412.0 * cop_rating / 12000.0
+
+
+def warmup():
+    """Trigger JIT compilation once at startup so requests never pay it"""
+    heating_cost(1.0, 1.0, 10.0)
+    cooling_cost(1.0, 1.0, 80.0)
+    carbon_footprint(1.0)
+    btu_output(1.0, 0.85)
+    condensate_return(1.0)
+    heat_transfer(1.0, 0.9)
+    cooling_capacity(1.0, 3.5)
@@ -4,16 +4,36 @@ Handles S3, RDS, SES, SNS, and CloudWatch integrations
 """
 
 import boto3
+import boto3.session
+import io
 import json
+import atexit
+import concurrent.futures
+import queue
+import threading
+import time
+from boto3.s3.transfer import TransferConfig
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from decimal import Decimal
+from functools import lru_cache
 from typing import Dict, List, Optional, Union
 from django.conf import settings
 try:
     import pymysql
 except ImportError:
     pymysql = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_dumps(obj) -> str:
+    """Serialize to JSON, using orjson's C encoder when available"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj)
 
 
 # AWS Configuration from services-details.txt
@@ -31,24 +51,81 @@ AWS_CONFIG = {
 }
 
 
+# Shared boto3 session and per-service client cache. Client construction is
+# expensive (credential chain, endpoint resolution), so build each client
+# once per process and share it across all manager instances.
+_SESSION = boto3.session.Session(region_name=AWS_CONFIG['region_name'])
+
+
+@lru_cache(maxsize=None)
+def _client(service_name: str):
+    """Get a cached boto3 client for the given service"""
+    return _SESSION.client(service_name)
+
+
+# Shared pool for fire-and-forget AWS side effects. Kept small: boto3
+# clients degrade under large thread counts and these calls are rare
+# per request.
+_IO_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=8, thread_name_prefix='egsa-aws'
+)
+
+
+def _log_async_failure(future):
+    """Done-callback that surfaces errors from fire-and-forget calls"""
+    try:
+        future.result()
+    except Exception as e:
+        logging.error(f"Async AWS call error: {e}")
+
+
+def _submit_async(fn, *args, **kwargs):
+    """Run an AWS call on the shared pool, logging any failure"""
+    future = _IO_POOL.submit(fn, *args, **kwargs)
+    future.add_done_callback(_log_async_failure)
+    return future
+
+
+def submit_background(fn, *args, **kwargs):
+    """Run blocking AWS-bound work off the caller's thread
+
+    Fire-and-forget on the shared I/O pool; failures are logged rather
+    than raised. For views this keeps request latency independent of AWS
+    round trips.
+    """
+    return _submit_async(fn, *args, **kwargs)
+
+
 class S3Manager:
     """Handles S3 file operations"""
-    
+
+    # Chunked, threaded transfers: objects above 8 MB are split into 8 MB
+    # parts uploaded/downloaded in parallel instead of one serial stream
+    _transfer_config = TransferConfig(
+        multipart_threshold=8 * 1024 * 1024,
+        multipart_chunksize=8 * 1024 * 1024,
+        max_concurrency=10,
+        use_threads=True
+    )
+
     def __init__(self):
-        self.s3_client = boto3.client('s3', region_name=AWS_CONFIG['region_name'])
+        self.s3_client = _client('s3')
         self.bucket_name = AWS_CONFIG['s3_bucket']
-    
+
     def upload_report(self, file_content: str, file_key: str, content_type: str = 'text/plain') -> bool:
         """Upload report to S3"""
         try:
-            self.s3_client.put_object(
+            self.s3_client.upload_fileobj(
+                Fileobj=io.BytesIO(file_content.encode('utf-8')),
                 Bucket=self.bucket_name,
                 Key=f"reports/{file_key}",
-                Body=file_content,
-                ContentType=content_type,
-                Metadata={
-                    'generated_at': datetime.now().isoformat(),
-                    'app': 'egsa'
+                Config=self._transfer_config,
+                ExtraArgs={
+                    'ContentType': content_type,
+                    'Metadata': {
+                        'generated_at': datetime.now().isoformat(),
+                        'app': 'egsa'
+                    }
                 }
             )
             return True
@@ -59,32 +136,47 @@ class S3Manager:
     def download_report(self, file_key: str) -> Optional[str]:
         """Download report from S3"""
         try:
-            response = self.s3_client.get_object(
-                Bucket=self.bucket_name,
-                Key=f"reports/{file_key}"
+            buffer = io.BytesIO()
+            self.s3_client.download_fileobj(
+                self.bucket_name,
+                f"reports/{file_key}",
+                buffer,
+                Config=self._transfer_config
             )
-            return response['Body'].read().decode('utf-8')
+            return buffer.getvalue().decode('utf-8')
         except Exception as e:
             logging.error(f"S3 download error: {e}")
             return None
     
-    def list_reports(self) -> List[Dict]:
-        """List all reports in S3"""
-        try:
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.bucket_name,
-                Prefix='reports/'
-            )
-            
-            reports = []
-            for obj in response.get('Contents', []):
-                reports.append({
+    def iter_report(self, file_key: str, chunk_size: int = 64 * 1024):
+        """Stream a report's bytes from S3 in fixed-size chunks"""
+        response = self.s3_client.get_object(
+            Bucket=self.bucket_name,
+            Key=f"reports/{file_key}"
+        )
+        return response['Body'].iter_chunks(chunk_size)
+
+    def iter_reports(self):
+        """Iterate over all reports in S3, one page of keys at a time"""
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        pages = paginator.paginate(
+            Bucket=self.bucket_name,
+            Prefix='reports/',
+            PaginationConfig={'PageSize': 1000}
+        )
+        for page in pages:
+            for obj in page.get('Contents', []):
+                yield {
                     'key': obj['Key'],
                     'size': obj['Size'],
                     'last_modified': obj['LastModified'],
                     'filename': obj['Key'].split('/')[-1]
-                })
-            return reports
+                }
+
+    def list_reports(self) -> List[Dict]:
+        """List all reports in S3"""
+        try:
+            return list(self.iter_reports())
         except Exception as e:
             logging.error(f"S3 list error: {e}")
             return []
@@ -103,9 +195,41 @@ class S3Manager:
             return None
 
 
+class _MySQLConnectionPool:
+    """Small LIFO pool of live pymysql connections
+
+    Keeps warm sockets around so hot paths skip the TCP+TLS+MySQL
+    handshake on every call.
+    """
+
+    def __init__(self, connection_params: Dict, maxsize: int = 5):
+        self._params = connection_params
+        self._pool = queue.LifoQueue(maxsize)
+
+    def acquire(self):
+        """Get a live connection, reusing a pooled one when possible"""
+        try:
+            connection = self._pool.get_nowait()
+        except queue.Empty:
+            return pymysql.connect(**self._params)
+
+        try:
+            connection.ping(reconnect=True)
+        except Exception:
+            return pymysql.connect(**self._params)
+        return connection
+
+    def release(self, connection):
+        """Return a connection to the pool, closing it if the pool is full"""
+        try:
+            self._pool.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+
 class RDSManager:
     """Handles RDS MySQL operations"""
-    
+
     def __init__(self):
         self.connection_params = {
             'host': AWS_CONFIG['rds_endpoint'],
@@ -114,12 +238,12 @@ class RDSManager:
             'database': AWS_CONFIG['rds_database'],
             'port': 3306
         }
-    
+        self._pool = _MySQLConnectionPool(self.connection_params)
+
     def get_connection(self):
-        """Get MySQL connection"""
+        """Get MySQL connection from the pool"""
         try:
-            connection = pymysql.connect(**self.connection_params)
-            return connection
+            return self._pool.acquire()
         except Exception as e:
             logging.error(f"RDS connection error: {e}")
             return None
@@ -153,7 +277,7 @@ class RDSManager:
             logging.error(f"RDS insert error: {e}")
             return False
         finally:
-            connection.close()
+            self._pool.release(connection)
     
     def get_monthly_stats(self, user_id: int, year: int, month: int) -> Dict:
         """Get monthly statistics from RDS"""
@@ -162,45 +286,57 @@ class RDSManager:
             return {}
         
         try:
-            cursor = connection.cursor(pymysql.cursors.DictCursor)
+            # Unbuffered cursor streams rows instead of materializing the
+            # full result set client-side
+            cursor = connection.cursor(pymysql.cursors.SSDictCursor)
+            # Range predicate instead of YEAR()/MONTH() so the
+            # (user_id, reading_date) index can be used
+            month_start = datetime(year, month, 1)
+            month_end = datetime(year + 1, 1, 1) if month == 12 else datetime(year, month + 1, 1)
             query = """
-                SELECT 
+                SELECT
                     utility_type,
                     COUNT(*) as reading_count,
                     SUM(reading_value) as total_usage,
                     SUM(cost) as total_cost,
                     AVG(reading_value) as avg_usage
-                FROM utility_readings 
-                WHERE user_id = %s 
-                AND YEAR(reading_date) = %s 
-                AND MONTH(reading_date) = %s
+                FROM utility_readings
+                WHERE user_id = %s
+                AND reading_date >= %s
+                AND reading_date < %s
                 GROUP BY utility_type
             """
-            cursor.execute(query, (user_id, year, month))
-            results = cursor.fetchall()
-            
+            cursor.execute(query, (user_id, month_start, month_end))
+
+            # Keep the Decimal values pymysql hands back; JSON responses
+            # serialize them via DjangoJSONEncoder at the boundary
             stats = {}
-            for row in results:
+            for row in cursor:
                 stats[row['utility_type']] = {
                     'reading_count': row['reading_count'],
-                    'total_usage': float(row['total_usage'] or 0),
-                    'total_cost': float(row['total_cost'] or 0),
-                    'avg_usage': float(row['avg_usage'] or 0)
+                    'total_usage': row['total_usage'] or Decimal('0'),
+                    'total_cost': row['total_cost'] or Decimal('0'),
+                    'avg_usage': row['avg_usage'] or Decimal('0')
                 }
             return stats
         except Exception as e:
             logging.error(f"RDS query error: {e}")
             return {}
         finally:
-            connection.close()
+            self._pool.release(connection)
 
 
 class SESManager:
     """Handles SES email operations"""
-    
+
+    # SendBulkTemplatedEmail accepts up to 50 destinations per call
+    _BULK_BATCH_SIZE = 50
+    _REPORT_TEMPLATE_NAME = 'egsa-monthly-report'
+
     def __init__(self):
-        self.ses_client = boto3.client('ses', region_name=AWS_CONFIG['region_name'])
+        self.ses_client = _client('ses')
         self.verified_email = AWS_CONFIG['ses_email']
+        self._template_ready = False
     
     def send_notification_email(self, to_email: str, subject: str, message: str, html_content: Optional[str] = None) -> bool:
         """Send notification email via SES"""
@@ -223,49 +359,105 @@ class SESManager:
             logging.error(f"SES send error: {e}")
             return False
     
-    def send_monthly_report_email(self, to_email: str, report_data: Dict) -> bool:
-        """Send monthly report via email"""
-        subject = f"EGSA Monthly Report - {report_data.get('period', 'Current Month')}"
-        
-        html_content = f"""
+    def _ensure_report_template(self):
+        """Create the SES monthly report template if not yet registered"""
+        if self._template_ready:
+            return
+
+        html_part = """
         <html>
         <body>
             <h2>EGSA Monthly Utility Report</h2>
-            <p><strong>Period:</strong> {report_data.get('period', 'N/A')}</p>
-            <p><strong>Total Cost:</strong> ${report_data.get('total_cost', 0):.2f}</p>
-            
+            <p><strong>Period:</strong> {{period}}</p>
+            <p><strong>Total Cost:</strong> ${{total_cost}}</p>
+
             <h3>Efficiency Scores:</h3>
-            <ul>
-        """
-        
-        for utility, score in report_data.get('average_efficiency', {}).items():
-            html_content += f"<li><strong>{utility.title()}:</strong> {score}</li>"
-        
-        html_content += f"""
-            </ul>
-            <p><strong>Cost Trend:</strong> {report_data.get('cost_trend', 'N/A')}</p>
-            <p>Generated by EGSA System on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+            <ul>{{{efficiency_html}}}</ul>
+            <p><strong>Cost Trend:</strong> {{cost_trend}}</p>
+            <p>Generated by EGSA System on {{generated_at}}</p>
         </body>
         </html>
         """
-        
-        text_content = f"""
+
+        text_part = """
         EGSA Monthly Utility Report
-        Period: {report_data.get('period', 'N/A')}
-        Total Cost: ${report_data.get('total_cost', 0):.2f}
-        Cost Trend: {report_data.get('cost_trend', 'N/A')}
-        
+        Period: {{period}}
+        Total Cost: ${{total_cost}}
+        Cost Trend: {{cost_trend}}
+
         Generated by EGSA System
         """
-        
-        return self.send_notification_email(to_email, subject, text_content, html_content)
+
+        try:
+            self.ses_client.create_template(
+                Template={
+                    'TemplateName': self._REPORT_TEMPLATE_NAME,
+                    'SubjectPart': 'EGSA Monthly Report - {{period}}',
+                    'HtmlPart': html_part,
+                    'TextPart': text_part
+                }
+            )
+        except self.ses_client.exceptions.AlreadyExistsException:
+            pass
+        self._template_ready = True
+
+    @staticmethod
+    def _report_template_data(report_data: Dict) -> Dict:
+        """Build per-destination replacement data for the report template"""
+        efficiency_html = "".join(
+            f"<li><strong>{utility.title()}:</strong> {score}</li>"
+            for utility, score in report_data.get('average_efficiency', {}).items()
+        )
+
+        return {
+            'period': report_data.get('period', 'N/A'),
+            'total_cost': f"{report_data.get('total_cost', 0):.2f}",
+            'cost_trend': report_data.get('cost_trend', 'N/A'),
+            'efficiency_html': efficiency_html,
+            'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
+
+    def send_monthly_report_emails(self, destinations: List[tuple]) -> bool:
+        """Send monthly reports to many recipients via SendBulkTemplatedEmail
+
+        destinations is a list of (to_email, report_data) pairs; up to 50
+        recipients are delivered per API call.
+        """
+        try:
+            self._ensure_report_template()
+
+            entries = [
+                {
+                    'Destination': {'ToAddresses': [to_email]},
+                    'ReplacementTemplateData': json.dumps(
+                        self._report_template_data(report_data)
+                    )
+                }
+                for to_email, report_data in destinations
+            ]
+
+            for start in range(0, len(entries), self._BULK_BATCH_SIZE):
+                self.ses_client.send_bulk_templated_email(
+                    Source=self.verified_email,
+                    Template=self._REPORT_TEMPLATE_NAME,
+                    DefaultTemplateData='{}',
+                    Destinations=entries[start:start + self._BULK_BATCH_SIZE]
+                )
+            return True
+        except Exception as e:
+            logging.error(f"SES bulk send error: {e}")
+            return False
+
+    def send_monthly_report_email(self, to_email: str, report_data: Dict) -> bool:
+        """Send monthly report via email"""
+        return self.send_monthly_report_emails([(to_email, report_data)])
 
 
 class SNSManager:
     """Handles SNS notification operations"""
     
     def __init__(self):
-        self.sns_client = boto3.client('sns', region_name=AWS_CONFIG['region_name'])
+        self.sns_client = _client('sns')
         self.critical_topic_arn = AWS_CONFIG['sns_critical_topic']
         self.general_topic_arn = AWS_CONFIG['sns_general_topic']
     
@@ -311,29 +503,103 @@ class SNSManager:
             return self.send_critical_alert(message, f"High {utility_type.title()} Usage Alert")
         return False
 
+    def send_critical_alert_async(self, message: str, subject: str = "EGSA Critical Alert"):
+        """Fire-and-forget variant of send_critical_alert"""
+        _submit_async(self.send_critical_alert, message, subject)
+
+    def send_general_notification_async(self, message: str, subject: str = "EGSA Notification"):
+        """Fire-and-forget variant of send_general_notification"""
+        _submit_async(self.send_general_notification, message, subject)
+
+    def send_usage_alert_async(self, utility_type: str, current_usage: float, threshold: float):
+        """Fire-and-forget variant of send_usage_alert"""
+        _submit_async(self.send_usage_alert, utility_type, current_usage, threshold)
+
 
 class CloudWatchManager:
     """Handles CloudWatch logging and monitoring"""
-    
+
+    # PutLogEvents accepts up to 10,000 events per call; batching keeps us
+    # well under the 5 TPS per-stream limit instead of one call per event
+    _LOG_BATCH_SIZE = 10000
+    _LOG_FLUSH_INTERVAL = 1.0  # seconds
+
+    # PutMetricData accepts up to 1000 entries per call
+    _METRIC_BATCH_SIZE = 1000
+
     def __init__(self):
-        self.logs_client = boto3.client('logs', region_name=AWS_CONFIG['region_name'])
-        self.cloudwatch_client = boto3.client('cloudwatch', region_name=AWS_CONFIG['region_name'])
+        self.logs_client = _client('logs')
+        self.cloudwatch_client = _client('cloudwatch')
         self.log_group = AWS_CONFIG['cloudwatch_log_group']
-    
+        self._log_queue = queue.Queue()
+        self._created_streams: set = set()
+        self._flusher_started = False
+        self._flusher_lock = threading.Lock()
+        self._metric_buffer: List[Dict] = []
+        self._metric_lock = threading.Lock()
+        atexit.register(self.flush_metrics)
+
     def log_utility_event(self, event_type: str, data: Dict) -> bool:
-        """Log utility event to CloudWatch"""
+        """Queue utility event for batched delivery to CloudWatch"""
         try:
+            now = datetime.now(timezone.utc)
             log_event = {
-                'timestamp': int(datetime.now().timestamp() * 1000),
-                'message': json.dumps({
+                'timestamp': int(now.timestamp() * 1000),
+                'message': _json_dumps({
                     'event_type': event_type,
-                    'timestamp': datetime.now().isoformat(),
+                    'timestamp': now.isoformat(),
                     'data': data
                 })
             }
-            
-            # Create log stream if it doesn't exist
-            stream_name = f"egsa-{datetime.now().strftime('%Y-%m-%d')}"
+
+            stream_name = f"egsa-{now.strftime('%Y-%m-%d')}"
+            self._ensure_flusher()
+            self._log_queue.put((stream_name, log_event))
+            return True
+        except Exception as e:
+            logging.error(f"CloudWatch logging error: {e}")
+            return False
+
+    def _ensure_flusher(self):
+        """Start the background log flusher thread on first use"""
+        if self._flusher_started:
+            return
+        with self._flusher_lock:
+            if not self._flusher_started:
+                flusher = threading.Thread(
+                    target=self._flush_loop,
+                    name='egsa-cloudwatch-flusher',
+                    daemon=True
+                )
+                flusher.start()
+                self._flusher_started = True
+
+    def _flush_loop(self):
+        """Drain queued log events and ship them in batches"""
+        while True:
+            try:
+                stream_name, log_event = self._log_queue.get()
+                batches = {stream_name: [log_event]}
+
+                # Collect whatever else has accumulated before flushing
+                while True:
+                    try:
+                        stream_name, log_event = self._log_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    batches.setdefault(stream_name, []).append(log_event)
+
+                for stream_name, events in batches.items():
+                    self._flush_stream(stream_name, events)
+            except Exception as e:
+                logging.error(f"CloudWatch log flush error: {e}")
+
+            time.sleep(self._LOG_FLUSH_INTERVAL)
+
+    def _flush_stream(self, stream_name: str, events: List[Dict]):
+        """Send one stream's events via put_log_events in batches"""
+        # Only attempt stream creation once per stream per process
+        if stream_name not in self._created_streams:
             try:
                 self.logs_client.create_log_stream(
                     logGroupName=self.log_group,
@@ -341,44 +607,94 @@ class CloudWatchManager:
                 )
             except self.logs_client.exceptions.ResourceAlreadyExistsException:
                 pass
-            
-            # Put log events
+            self._created_streams.add(stream_name)
+
+        events.sort(key=lambda event: event['timestamp'])
+        for start in range(0, len(events), self._LOG_BATCH_SIZE):
             self.logs_client.put_log_events(
                 logGroupName=self.log_group,
                 logStreamName=stream_name,
-                logEvents=[log_event]
+                logEvents=events[start:start + self._LOG_BATCH_SIZE]
             )
-            return True
-        except Exception as e:
-            logging.error(f"CloudWatch logging error: {e}")
-            return False
     
     def put_custom_metric(self, metric_name: str, value: float, unit: str = 'Count', utility_type: Optional[str] = None) -> bool:
-        """Put custom metric to CloudWatch"""
+        """Buffer a custom metric for batched delivery to CloudWatch"""
         try:
             dimensions = [{'Name': 'Application', 'Value': 'EGSA'}]
             if utility_type:
                 dimensions.append({'Name': 'UtilityType', 'Value': utility_type})
-            
+
             # Use current UTC time to avoid timezone issues
-            from datetime import timezone
             current_time = datetime.now(timezone.utc)
-            
-            self.cloudwatch_client.put_metric_data(
-                Namespace='EGSA/Utilities',
-                MetricData=[{
+
+            with self._metric_lock:
+                self._metric_buffer.append({
                     'MetricName': metric_name,
                     'Value': value,
                     'Unit': unit,
                     'Dimensions': dimensions,
                     'Timestamp': current_time
-                }]
-            )
+                })
+                flush_needed = len(self._metric_buffer) >= self._METRIC_BATCH_SIZE
+
+            if flush_needed:
+                self.flush_metrics()
+            return True
+        except Exception as e:
+            logging.error(f"CloudWatch metric error: {e}")
+            return False
+
+    def flush_metrics(self) -> bool:
+        """Flush buffered metrics to CloudWatch in batches"""
+        with self._metric_lock:
+            pending, self._metric_buffer = self._metric_buffer, []
+
+        try:
+            for start in range(0, len(pending), self._METRIC_BATCH_SIZE):
+                self.cloudwatch_client.put_metric_data(
+                    Namespace='EGSA/Utilities',
+                    MetricData=pending[start:start + self._METRIC_BATCH_SIZE]
+                )
             return True
         except Exception as e:
             logging.error(f"CloudWatch metric error: {e}")
             return False
     
+    def put_custom_metrics(self, metrics: List[Dict]) -> bool:
+        """Put several custom metrics to CloudWatch in one API call
+
+        Each entry is a dict with metric_name, value and optional unit /
+        utility_type keys; all entries share one PutMetricData request.
+        """
+        try:
+            current_time = datetime.now(timezone.utc)
+            metric_data = []
+            for metric in metrics:
+                dimensions = [{'Name': 'Application', 'Value': 'EGSA'}]
+                if metric.get('utility_type'):
+                    dimensions.append({'Name': 'UtilityType', 'Value': metric['utility_type']})
+                metric_data.append({
+                    'MetricName': metric['metric_name'],
+                    'Value': metric['value'],
+                    'Unit': metric.get('unit', 'Count'),
+                    'Dimensions': dimensions,
+                    'Timestamp': current_time
+                })
+
+            for start in range(0, len(metric_data), self._METRIC_BATCH_SIZE):
+                self.cloudwatch_client.put_metric_data(
+                    Namespace='EGSA/Utilities',
+                    MetricData=metric_data[start:start + self._METRIC_BATCH_SIZE]
+                )
+            return True
+        except Exception as e:
+            logging.error(f"CloudWatch metric error: {e}")
+            return False
+
+    def put_custom_metric_async(self, metric_name: str, value: float, unit: str = 'Count', utility_type: Optional[str] = None):
+        """Fire-and-forget variant of put_custom_metric"""
+        _submit_async(self.put_custom_metric, metric_name, value, unit, utility_type)
+
     def log_user_action(self, user_id: int, action: str, details: Optional[Dict] = None) -> bool:
         """Log user action for audit trail"""
         event_data = {
@@ -392,38 +708,49 @@ class CloudWatchManager:
 # Factory class for AWS managers
 class AWSManagerFactory:
     """Factory for creating AWS service managers"""
-    
+
     _instances = {}
-    
+    _lock = threading.Lock()
+    _builders = {
+        's3': S3Manager,
+        'rds': RDSManager,
+        'ses': SESManager,
+        'sns': SNSManager,
+        'cloudwatch': CloudWatchManager,
+    }
+
+    @classmethod
+    def get(cls, service_name: str):
+        """Get the singleton manager for a service (thread-safe)"""
+        # Fast path: already built, no lock needed
+        try:
+            return cls._instances[service_name]
+        except KeyError:
+            pass
+        with cls._lock:
+            if service_name not in cls._instances:
+                cls._instances[service_name] = cls._builders[service_name]()
+            return cls._instances[service_name]
+
     @classmethod
     def get_s3_manager(cls):
-        if 's3' not in cls._instances:
-            cls._instances['s3'] = S3Manager()
-        return cls._instances['s3']
-    
+        return cls.get('s3')
+
     @classmethod
     def get_rds_manager(cls):
-        if 'rds' not in cls._instances:
-            cls._instances['rds'] = RDSManager()
-        return cls._instances['rds']
-    
+        return cls.get('rds')
+
     @classmethod
     def get_ses_manager(cls):
-        if 'ses' not in cls._instances:
-            cls._instances['ses'] = SESManager()
-        return cls._instances['ses']
-    
+        return cls.get('ses')
+
     @classmethod
     def get_sns_manager(cls):
-        if 'sns' not in cls._instances:
-            cls._instances['sns'] = SNSManager()
-        return cls._instances['sns']
-    
+        return cls.get('sns')
+
     @classmethod
     def get_cloudwatch_manager(cls):
-        if 'cloudwatch' not in cls._instances:
-            cls._instances['cloudwatch'] = CloudWatchManager()
-        return cls._instances['cloudwatch']
+        return cls.get('cloudwatch')
 
 
 # Export classes
@@ -434,5 +761,6 @@ __all__ = [
     'SNSManager',
     'CloudWatchManager',
     'AWSManagerFactory',
-    'AWS_CONFIG'
+    'AWS_CONFIG',
+    'submit_background'
 ]
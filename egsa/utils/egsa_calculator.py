@@ -3,41 +3,55 @@ EGSA Calculator Library - Object-Oriented Utility Management System
 A custom library for Electricity, Gas, Steam, and Air Conditioning calculations
 """
 
-from decimal import Decimal
-from typing import Dict, List, Optional
-from datetime import datetime, timedelta
-import math
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Dict, List
+from datetime import datetime
+
+from . import _kernels
+
+
+# Efficiency rating <-> numeric score tables
+SCORE_VALUE = {'Excellent': 4, 'Good': 3, 'Average': 2, 'Poor': 1}
+VALUE_SCORE = {4: 'Excellent', 3: 'Good', 2: 'Average', 1: 'Poor'}
+
+# Ratings indexed by how many of the 0.8/1.0/1.2 ratio thresholds are
+# exceeded (see UtilityCalculator.get_efficiency_rating)
+_RATINGS = ('Excellent', 'Good', 'Average', 'Poor')
 
 
 class UtilityCalculator:
     """Base class for utility calculations"""
-    
-    def __init__(self, rate_per_unit: float = 0.0):
-        self.rate_per_unit = Decimal(str(rate_per_unit))
+
+    def __init__(self, rate_per_unit: float = 0.0, track_history: bool = False):
+        self.rate_per_unit = rate_per_unit
         self.calculation_history = []
-    
-    def calculate_cost(self, usage: float) -> Decimal:
-        """Calculate cost based on usage"""
-        cost = Decimal(str(usage)) * self.rate_per_unit
-        self.calculation_history.append({
-            'usage': usage,
-            'rate': float(self.rate_per_unit),
-            'cost': float(cost),
-            'timestamp': datetime.now()
-        })
+        self._track_history = track_history
+
+    def calculate_cost(self, usage: float) -> float:
+        """Calculate cost based on usage
+
+        Computed in float; callers convert to Decimal once at the DB or
+        display boundary.
+        """
+        cost = usage * self.rate_per_unit
+        if self._track_history:
+            self.calculation_history.append({
+                'usage': usage,
+                'rate': self.rate_per_unit,
+                'cost': cost,
+                'timestamp': datetime.now()
+            })
         return cost
     
     def get_efficiency_rating(self, usage: float, benchmark: float) -> str:
         """Get efficiency rating compared to benchmark"""
-        ratio = usage / benchmark if benchmark > 0 else 1
-        if ratio <= 0.8:
-            return "Excellent"
-        elif ratio <= 1.0:
+        if benchmark <= 0:
             return "Good"
-        elif ratio <= 1.2:
-            return "Average"
-        else:
-            return "Poor"
+        ratio = usage / benchmark
+        # Count exceeded thresholds and index the rating table directly
+        # instead of walking an if/elif chain
+        return _RATINGS[(ratio > 0.8) + (ratio > 1.0) + (ratio > 1.2)]
 
 
 class ElectricityCalculator(UtilityCalculator):
@@ -48,27 +62,33 @@ class ElectricityCalculator(UtilityCalculator):
         self.peak_hours = (17, 21)  # 5 PM to 9 PM
         self.peak_rate_multiplier = 1.5
     
-    def calculate_peak_cost(self, usage: float, hour: int) -> Decimal:
+    def calculate_peak_cost(self, usage: float, hour: int) -> float:
         """Calculate cost considering peak hour rates"""
         base_cost = self.calculate_cost(usage)
         if self.peak_hours[0] <= hour <= self.peak_hours[1]:
-            return base_cost * Decimal(str(self.peak_rate_multiplier))
+            return base_cost * self.peak_rate_multiplier
         return base_cost
     
     def estimate_carbon_footprint(self, kwh_usage: float) -> float:
         """Estimate CO2 emissions in kg"""
-        # Average emission factor: 0.5 kg CO2 per kWh
-        return kwh_usage * 0.5
+        return _kernels.carbon_footprint(kwh_usage)
     
-    def recommend_savings(self, monthly_usage: float) -> Dict[str, str]:
+    # Recommendations by usage bucket, highest threshold first
+    _SAVING_RECS = (
+        (500, ("Consider LED lighting and energy-efficient appliances",
+               "Use programmable thermostats",
+               "Unplug devices when not in use")),
+        (300, ("Use programmable thermostats",
+               "Unplug devices when not in use")),
+        (0, ("Unplug devices when not in use",)),
+    )
+
+    def recommend_savings(self, monthly_usage: float) -> tuple:
         """Provide energy saving recommendations"""
-        recommendations = {}
-        if monthly_usage > 500:
-            recommendations['high_usage'] = "Consider LED lighting and energy-efficient appliances"
-        if monthly_usage > 300:
-            recommendations['moderate_usage'] = "Use programmable thermostats"
-        recommendations['general'] = "Unplug devices when not in use"
-        return recommendations
+        for threshold, recommendations in self._SAVING_RECS:
+            if monthly_usage > threshold:
+                return recommendations
+        return self._SAVING_RECS[-1][1]
 
 
 class GasCalculator(UtilityCalculator):
@@ -78,17 +98,17 @@ class GasCalculator(UtilityCalculator):
         super().__init__(rate_per_cubic_meter)
         self.heating_efficiency = 0.85  # 85% efficiency
     
-    def calculate_heating_cost(self, cubic_meters: float, outdoor_temp: float) -> Decimal:
+    def calculate_heating_cost(self, cubic_meters: float, outdoor_temp: float) -> float:
         """Calculate heating cost adjusted for outdoor temperature"""
-        base_cost = self.calculate_cost(cubic_meters)
-        # Increase cost for colder temperatures
-        temp_factor = max(0.5, (20 - outdoor_temp) / 20)
-        return base_cost * Decimal(str(temp_factor))
-    
+        if self._track_history:
+            # Route through calculate_cost so the base cost is recorded
+            base_cost = self.calculate_cost(cubic_meters)
+            return base_cost * max(0.5, (20 - outdoor_temp) / 20)
+        return _kernels.heating_cost(cubic_meters, self.rate_per_unit, outdoor_temp)
+
     def estimate_btu_output(self, cubic_meters: float) -> float:
         """Estimate BTU output from gas consumption"""
-        # 1 cubic meter ≈ 35,300 BTU
-        return cubic_meters * 35300 * self.heating_efficiency
+        return _kernels.btu_output(cubic_meters, self.heating_efficiency)
 
 
 class SteamCalculator(UtilityCalculator):
@@ -101,13 +121,11 @@ class SteamCalculator(UtilityCalculator):
     
     def calculate_condensate_return(self, steam_usage: float) -> float:
         """Calculate condensate return percentage"""
-        # Typical condensate return is 80-95%
-        return steam_usage * 0.85
-    
+        return _kernels.condensate_return(steam_usage)
+
     def estimate_heat_transfer(self, pounds_steam: float) -> float:
         """Estimate heat transfer in BTU"""
-        # Steam latent heat ≈ 970 BTU/lb at 15 PSI
-        return pounds_steam * 970 * self.efficiency_factor
+        return _kernels.heat_transfer(pounds_steam, self.efficiency_factor)
 
 
 class AirConditioningCalculator(UtilityCalculator):
@@ -118,18 +136,17 @@ class AirConditioningCalculator(UtilityCalculator):
         self.cop_rating = 3.5  # Coefficient of Performance
         self.seasonal_factor = 1.0
     
-    def calculate_cooling_cost(self, kwh_usage: float, outdoor_temp: float) -> Decimal:
+    def calculate_cooling_cost(self, kwh_usage: float, outdoor_temp: float) -> float:
         """Calculate cooling cost adjusted for outdoor temperature"""
-        base_cost = self.calculate_cost(kwh_usage)
-        # Increase cost for hotter temperatures
-        temp_factor = max(0.8, (outdoor_temp - 70) / 30 + 1)
-        return base_cost * Decimal(str(temp_factor))
-    
+        if self._track_history:
+            # Route through calculate_cost so the base cost is recorded
+            base_cost = self.calculate_cost(kwh_usage)
+            return base_cost * max(0.8, (outdoor_temp - 70) / 30 + 1)
+        return _kernels.cooling_cost(kwh_usage, self.rate_per_unit, outdoor_temp)
+
     def estimate_cooling_capacity(self, kwh_consumption: float) -> float:
         """Estimate cooling capacity in tons"""
-        # 1 ton = 12,000 BTU/hr, 1 kWh ≈ 3,412 BTU
-        btu_output = kwh_consumption * 3412 * self.cop_rating
-        return btu_output / 12000
+        return _kernels.cooling_capacity(kwh_consumption, self.cop_rating)
     
     def recommend_temperature_settings(self, outdoor_temp: float) -> Dict[str, int]:
         """Recommend optimal temperature settings"""
@@ -143,137 +160,115 @@ class AirConditioningCalculator(UtilityCalculator):
 
 class EGSAAnalyzer:
     """Main analyzer class for comprehensive EGSA management"""
-    
+
+    UTILITY_KEYS = ('electricity', 'gas', 'steam', 'air_conditioning')
+
+    # (utility key, cost method, default benchmark, optional extra arg as
+    # (name, default)); keys double as calculator attribute names
+    _ANALYSIS_PLAN = (
+        ('electricity', 'calculate_cost', 400, None),
+        ('gas', 'calculate_heating_cost', 100, ('outdoor_temp', 20)),
+        ('steam', 'calculate_cost', 50, None),
+        ('air_conditioning', 'calculate_cooling_cost', 200, ('outdoor_temp', 75)),
+    )
+
     def __init__(self):
         self.electricity = ElectricityCalculator()
         self.gas = GasCalculator()
         self.steam = SteamCalculator()
         self.air_conditioning = AirConditioningCalculator()
-        self.analysis_history = []
+        # Column-oriented history: parallel arrays keyed by position, so
+        # report aggregation scans flat numeric columns instead of a list
+        # of per-analysis dicts (0 = utility absent from that analysis)
+        self._history_timestamps: List[datetime] = []
+        self._history_costs: List[float] = []
+        self._history_scores = {u: [] for u in self.UTILITY_KEYS}
     
     def comprehensive_analysis(self, utility_data: Dict) -> Dict:
         """Perform comprehensive analysis of all utilities"""
         analysis = {
             'timestamp': datetime.now(),
-            'total_cost': Decimal('0'),
+            'total_cost': 0.0,
             'efficiency_scores': {},
             'recommendations': [],
             'environmental_impact': {}
         }
-        
-        total_cost = Decimal('0')
-        efficiency_scores = {}
-        recommendations = []
-        environmental_impact = {}
-        
-        # Electricity analysis
-        if 'electricity' in utility_data:
-            elec_data = utility_data['electricity']
-            cost = self.electricity.calculate_cost(elec_data['usage'])
-            total_cost += cost
-            efficiency_scores['electricity'] = self.electricity.get_efficiency_rating(
-                elec_data['usage'], elec_data.get('benchmark', 400)
-            )
-            environmental_impact['co2_kg'] = self.electricity.estimate_carbon_footprint(
-                elec_data['usage']
-            )
-            recommendations.extend(
-                list(self.electricity.recommend_savings(elec_data['usage']).values())
-            )
-        
-        # Gas analysis
-        if 'gas' in utility_data:
-            gas_data = utility_data['gas']
-            cost = self.gas.calculate_heating_cost(
-                gas_data['usage'], 
-                gas_data.get('outdoor_temp', 20)
-            )
-            total_cost += cost
-            efficiency_scores['gas'] = self.gas.get_efficiency_rating(
-                gas_data['usage'], gas_data.get('benchmark', 100)
-            )
-        
-        # Steam analysis
-        if 'steam' in utility_data:
-            steam_data = utility_data['steam']
-            cost = self.steam.calculate_cost(steam_data['usage'])
-            total_cost += cost
-            efficiency_scores['steam'] = self.steam.get_efficiency_rating(
-                steam_data['usage'], steam_data.get('benchmark', 50)
-            )
-        
-        # Air conditioning analysis
-        if 'air_conditioning' in utility_data:
-            ac_data = utility_data['air_conditioning']
-            cost = self.air_conditioning.calculate_cooling_cost(
-                ac_data['usage'], 
-                ac_data.get('outdoor_temp', 75)
-            )
-            total_cost += cost
-            efficiency_scores['air_conditioning'] = self.air_conditioning.get_efficiency_rating(
-                ac_data['usage'], ac_data.get('benchmark', 200)
+
+        efficiency_scores = analysis['efficiency_scores']
+
+        for key, cost_fn, default_benchmark, extra in self._ANALYSIS_PLAN:
+            data = utility_data.get(key)
+            if not data:
+                continue
+
+            calculator = getattr(self, key)
+            if extra is None:
+                cost = getattr(calculator, cost_fn)(data['usage'])
+            else:
+                cost = getattr(calculator, cost_fn)(data['usage'], data.get(*extra))
+            analysis['total_cost'] += cost
+
+            efficiency_scores[key] = calculator.get_efficiency_rating(
+                data['usage'], data.get('benchmark', default_benchmark)
             )
-        
-        # Update analysis dict
-        analysis['total_cost'] = total_cost
-        analysis['efficiency_scores'] = efficiency_scores
-        analysis['recommendations'] = recommendations
-        analysis['environmental_impact'] = environmental_impact
-        
-        self.analysis_history.append(analysis)
+
+            if key == 'electricity':
+                analysis['environmental_impact']['co2_kg'] = calculator.estimate_carbon_footprint(
+                    data['usage']
+                )
+                analysis['recommendations'].extend(calculator.recommend_savings(data['usage']))
+
+        self._record_analysis(analysis)
         return analysis
-    
+
+    def _record_analysis(self, analysis: Dict):
+        """Append one analysis to the column-oriented history"""
+        self._history_timestamps.append(analysis['timestamp'])
+        self._history_costs.append(float(analysis['total_cost']))
+        scores = analysis['efficiency_scores']
+        for utility in self.UTILITY_KEYS:
+            score = scores.get(utility)
+            self._history_scores[utility].append(SCORE_VALUE[score] if score else 0)
+
     def generate_monthly_report(self, start_date: datetime, end_date: datetime) -> Dict:
         """Generate comprehensive monthly report"""
-        relevant_analyses = [
-            analysis for analysis in self.analysis_history
-            if start_date <= analysis['timestamp'] <= end_date
-        ]
-        
-        if not relevant_analyses:
+        # History is appended chronologically, so the window is a slice
+        start = bisect_left(self._history_timestamps, start_date)
+        end = bisect_right(self._history_timestamps, end_date)
+
+        if start >= end:
             return {'error': 'No data available for the specified period'}
-        
-        total_cost = sum(analysis['total_cost'] for analysis in relevant_analyses)
-        avg_efficiency = self._calculate_average_efficiency(relevant_analyses)
-        
+
+        total_cost = sum(self._history_costs[start:end])
+        avg_efficiency = self._calculate_average_efficiency(start, end)
+
         return {
             'period': f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}",
-            'total_cost': float(total_cost),
+            'total_cost': total_cost,
             'average_efficiency': avg_efficiency,
-            'total_analyses': len(relevant_analyses),
-            'cost_trend': self._calculate_cost_trend(relevant_analyses)
+            'total_analyses': end - start,
+            'cost_trend': self._calculate_cost_trend(start, end)
         }
-    
-    def _calculate_average_efficiency(self, analyses: List[Dict]) -> Dict:
-        """Calculate average efficiency scores"""
-        efficiency_totals = {}
-        efficiency_counts = {}
-        
-        for analysis in analyses:
-            for utility, score in analysis['efficiency_scores'].items():
-                if utility not in efficiency_totals:
-                    efficiency_totals[utility] = 0
-                    efficiency_counts[utility] = 0
-                
-                score_value = {'Excellent': 4, 'Good': 3, 'Average': 2, 'Poor': 1}[score]
-                efficiency_totals[utility] += score_value
-                efficiency_counts[utility] += 1
-        
+
+    def _calculate_average_efficiency(self, start: int, end: int) -> Dict:
+        """Calculate average efficiency scores over a history window"""
         avg_scores = {}
-        for utility in efficiency_totals:
-            avg_value = efficiency_totals[utility] / efficiency_counts[utility]
-            avg_scores[utility] = {4: 'Excellent', 3: 'Good', 2: 'Average', 1: 'Poor'}[round(avg_value)]
-        
+        for utility, column in self._history_scores.items():
+            window = column[start:end]
+            total = sum(window)
+            if total:
+                count = sum(1 for value in window if value)
+                avg_scores[utility] = VALUE_SCORE[round(total / count)]
         return avg_scores
-    
-    def _calculate_cost_trend(self, analyses: List[Dict]) -> str:
+
+    def _calculate_cost_trend(self, start: int, end: int) -> str:
         """Calculate cost trend (increasing/decreasing/stable)"""
-        if len(analyses) < 2:
+        if end - start < 2:
             return "Insufficient data"
-        
-        recent_cost = float(analyses[-1]['total_cost'])
-        older_cost = float(analyses[0]['total_cost'])
-        
+
+        recent_cost = self._history_costs[end - 1]
+        older_cost = self._history_costs[start]
+
         if recent_cost > older_cost * 1.1:
             return "Increasing"
         elif recent_cost < older_cost * 0.9:
@@ -298,10 +293,21 @@ class UtilityCalculatorFactory:
         
         if utility_type not in calculators:
             raise ValueError(f"Unknown utility type: {utility_type}")
-        
+
         return calculators[utility_type](**kwargs)
 
 
+@lru_cache(maxsize=8)
+def get_default_calculator(utility_type: str):
+    """Get a shared default-configured calculator for a utility type
+
+    Default calculators are stateless (history tracking is off), so one
+    instance per type can be reused across requests instead of allocating
+    a fresh calculator per call.
+    """
+    return UtilityCalculatorFactory.create_calculator(utility_type)
+
+
 # Global analyzer instance
 _global_analyzer = None
 
@@ -322,5 +328,6 @@ __all__ = [
     'AirConditioningCalculator',
     'EGSAAnalyzer',
     'UtilityCalculatorFactory',
+    'get_default_calculator',
     'get_analyzer'
 ]
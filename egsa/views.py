@@ -1,25 +1,97 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.decorators import login_required
-from django.contrib.auth.models import User
 from django.contrib import messages
-from django.http import JsonResponse, HttpResponse
+from django.http import JsonResponse, HttpResponse, StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.core.paginator import Paginator
-from django.db.models import Sum, Avg, Count
+from django.db.models import Sum, Count
 from decimal import Decimal
-import json
 from datetime import datetime, timedelta
+from functools import lru_cache
+from types import MappingProxyType
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .models import UtilityReading, UserProfile, UtilityReport
-from .utils.egsa_calculator import get_analyzer, UtilityCalculatorFactory
-from .utils.aws_integration import AWSManagerFactory
+from .utils.egsa_calculator import get_analyzer, get_default_calculator
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
 
+def _json_response(data, **kwargs):
+    """Build a JSON response with orjson when installed
+
+    orjson serializes in C and is several times faster than the stdlib
+    encoder on large payloads; without it this falls back to Django's
+    JsonResponse.
+    """
+    if orjson is None:
+        return JsonResponse(data, **kwargs)
+    kwargs.setdefault('content_type', 'application/json')
+    return HttpResponse(orjson.dumps(data), **kwargs)
+
+# Per-utility benchmark and alert-threshold tables (read-only module
+# constants; in a real app these would come from settings)
+UTILITY_BENCHMARKS = MappingProxyType({
+    'electricity': 400,
+    'gas': 100,
+    'steam': 50,
+    'air_conditioning': 200
+})
+UTILITY_THRESHOLDS = MappingProxyType({
+    'electricity': 500,
+    'gas': 150,
+    'steam': 75,
+    'air_conditioning': 300
+})
+
+
+# The AWS layer (and its boto3 import) is loaded on first use rather
+# than at module import, so worker cold start doesn't pay for it
+@lru_cache(maxsize=None)
+def _aws():
+    from .utils import aws_integration
+    return aws_integration
+
+
+def submit_background(fn, *args, **kwargs):
+    """Run AWS-bound work on the shared background pool"""
+    return _aws().submit_background(fn, *args, **kwargs)
+
+
+# Managers are process-wide singletons, so cache the references here and
+# skip the factory dispatch on every call site
+@lru_cache(maxsize=None)
+def _cloudwatch_manager():
+    return _aws().AWSManagerFactory.get_cloudwatch_manager()
+
+
+@lru_cache(maxsize=None)
+def _s3_manager():
+    return _aws().AWSManagerFactory.get_s3_manager()
+
+
+@lru_cache(maxsize=None)
+def _ses_manager():
+    return _aws().AWSManagerFactory.get_ses_manager()
+
+
+@lru_cache(maxsize=None)
+def _sns_manager():
+    return _aws().AWSManagerFactory.get_sns_manager()
+
+
+@lru_cache(maxsize=None)
+def _rds_manager():
+    return _aws().AWSManagerFactory.get_rds_manager()
+
+
 def login_view(request):
     """Login page"""
     if request.method == 'POST':
@@ -31,7 +103,7 @@ def login_view(request):
             login(request, user)
             
             # Log user login
-            cloudwatch = AWSManagerFactory.get_cloudwatch_manager()
+            cloudwatch = _cloudwatch_manager()
             cloudwatch.log_user_action(user.id, 'login')
             
             messages.success(request, f'Welcome back, {user.first_name or user.username}!')
@@ -46,7 +118,7 @@ def login_view(request):
 def logout_view(request):
     """Logout user"""
     # Log user logout
-    cloudwatch = AWSManagerFactory.get_cloudwatch_manager()
+    cloudwatch = _cloudwatch_manager()
     cloudwatch.log_user_action(request.user.id, 'logout')
     
     logout(request)
@@ -57,22 +129,18 @@ def logout_view(request):
 @login_required
 def dashboard(request):
     """Main dashboard - Page 1"""
-    # Get recent readings
-    recent_readings = UtilityReading.objects.filter(user=request.user)[:5]
-    
-    # Get monthly statistics
-    current_month = datetime.now().month
-    current_year = datetime.now().year
-    
-    monthly_stats = UtilityReading.objects.filter(
-        user=request.user,
-        reading_date__month=current_month,
-        reading_date__year=current_year
-    ).values('utility_type').annotate(
-        total_usage=Sum('reading_value'),
-        total_cost=Sum('cost'),
-        avg_usage=Avg('reading_value'),
-        reading_count=Count('id')
+    # Get recent readings, projecting only the columns the template shows
+    recent_readings = UtilityReading.objects.filter(user=request.user).only(
+        'id', 'utility_type', 'reading_value', 'unit', 'cost', 'reading_date', 'location', 'user'
+    )[:5]
+    
+    # Get monthly statistics (read the clock once per request)
+    now = datetime.now()
+    current_month = now.month
+    current_year = now.year
+    
+    monthly_stats = UtilityReading.objects.monthly_stats(
+        request.user, current_year, current_month
     )
     
     # Calculate efficiency using our custom library
@@ -81,19 +149,11 @@ def dashboard(request):
     
     for stat in monthly_stats:
         utility_type = stat['utility_type']
-        calculator = UtilityCalculatorFactory.create_calculator(utility_type)
-        
-        # Mock benchmark data (in real app, this would come from settings)
-        benchmarks = {
-            'electricity': 400,
-            'gas': 100,
-            'steam': 50,
-            'air_conditioning': 200
-        }
-        
+        calculator = get_default_calculator(utility_type)
+
         efficiency_rating = calculator.get_efficiency_rating(
             float(stat['total_usage'] or 0),
-            benchmarks.get(utility_type, 100)
+            UTILITY_BENCHMARKS.get(utility_type, 100)
         )
         
         efficiency_data[utility_type] = {
@@ -102,29 +162,23 @@ def dashboard(request):
             'cost': float(stat['total_cost'] or 0)
         }
     
-    # Send metrics to CloudWatch
-    cloudwatch = AWSManagerFactory.get_cloudwatch_manager()
-    for utility_type, data in efficiency_data.items():
-        cloudwatch.put_custom_metric(
-            f'{utility_type}_monthly_usage',
-            data['usage'],
-            'Count',
-            utility_type
-        )
+    # Send all metrics to CloudWatch in a single PutMetricData call
+    cloudwatch = _cloudwatch_manager()
+    cloudwatch.put_custom_metrics([
+        {
+            'metric_name': f'{utility_type}_monthly_usage',
+            'value': data['usage'],
+            'utility_type': utility_type
+        }
+        for utility_type, data in efficiency_data.items()
+    ])
     
     # Check for high usage alerts
-    sns = AWSManagerFactory.get_sns_manager()
+    sns = _sns_manager()
     for utility_type, data in efficiency_data.items():
-        thresholds = {
-            'electricity': 500,
-            'gas': 150,
-            'steam': 75,
-            'air_conditioning': 300
-        }
-        
-        threshold = thresholds.get(utility_type, 100)
+        threshold = UTILITY_THRESHOLDS.get(utility_type, 100)
         if data['usage'] > threshold:
-            sns.send_usage_alert(utility_type, data['usage'], threshold)
+            sns.send_usage_alert_async(utility_type, data['usage'], threshold)
     
     context = {
         'recent_readings': recent_readings,
@@ -150,22 +204,22 @@ def utility_management(request):
         
         try:
             # Calculate cost using our custom library
-            calculator = UtilityCalculatorFactory.create_calculator(utility_type)
+            calculator = get_default_calculator(utility_type)
             cost = calculator.calculate_cost(float(reading_value))
-            
-            # Create reading
+
+            # Create reading (Decimal conversion happens once, at the DB boundary)
             reading = UtilityReading.objects.create(
                 user=request.user,
                 utility_type=utility_type,
                 reading_value=Decimal(reading_value),
                 unit=unit,
-                cost=cost,
+                cost=Decimal(f"{cost:.2f}"),
                 notes=notes,
                 location=location
             )
             
             # Log to CloudWatch
-            cloudwatch = AWSManagerFactory.get_cloudwatch_manager()
+            cloudwatch = _cloudwatch_manager()
             cloudwatch.log_utility_event('reading_created', {
                 'user_id': request.user.id,
                 'utility_type': utility_type,
@@ -173,9 +227,9 @@ def utility_management(request):
                 'cost': float(cost)
             })
             
-            # Store in RDS for backup
-            rds = AWSManagerFactory.get_rds_manager()
-            rds.store_utility_reading({
+            # Store in RDS for backup (off the request thread)
+            rds = _rds_manager()
+            submit_background(rds.store_utility_reading, {
                 'user_id': request.user.id,
                 'utility_type': utility_type,
                 'reading_value': float(reading_value),
@@ -194,8 +248,11 @@ def utility_management(request):
         
         return redirect('utility_management')
     
-    # Get all readings with pagination
-    readings_list = UtilityReading.objects.filter(user=request.user).order_by('-reading_date')
+    # Get all readings with pagination, skipping columns the list view
+    # never renders
+    readings_list = UtilityReading.objects.filter(user=request.user).only(
+        'id', 'utility_type', 'reading_value', 'unit', 'cost', 'reading_date', 'notes', 'location', 'user'
+    ).order_by('-reading_date')
     paginator = Paginator(readings_list, 10)  # Show 10 readings per page
     
     page_number = request.GET.get('page')
@@ -222,13 +279,13 @@ def edit_reading(request, reading_id):
         reading.location = request.POST.get('location')
         
         # Recalculate cost
-        calculator = UtilityCalculatorFactory.create_calculator(reading.utility_type)
-        reading.cost = calculator.calculate_cost(float(reading.reading_value))
+        calculator = get_default_calculator(reading.utility_type)
+        reading.cost = Decimal(f"{calculator.calculate_cost(float(reading.reading_value)):.2f}")
         
         reading.save()
         
         # Log update
-        cloudwatch = AWSManagerFactory.get_cloudwatch_manager()
+        cloudwatch = _cloudwatch_manager()
         cloudwatch.log_user_action(request.user.id, 'reading_updated', {'reading_id': str(reading_id)})
         
         messages.success(request, 'Reading updated successfully!')
@@ -249,7 +306,7 @@ def delete_reading(request, reading_id):
     
     if request.method == 'POST':
         # Log deletion
-        cloudwatch = AWSManagerFactory.get_cloudwatch_manager()
+        cloudwatch = _cloudwatch_manager()
         cloudwatch.log_user_action(request.user.id, 'reading_deleted', {'reading_id': str(reading_id)})
         
         reading.delete()
@@ -264,73 +321,73 @@ def delete_reading(request, reading_id):
 def reports(request):
     """Reports page - Page 3"""
     # Generate monthly report
-    month = int(request.GET.get('month', datetime.now().month))
-    year = int(request.GET.get('year', datetime.now().year))
-    
-    # Get readings for the month
-    readings = UtilityReading.objects.filter(
-        user=request.user,
-        reading_date__month=month,
-        reading_date__year=year
-    )
-    
-    # Aggregate data by utility type
-    utility_data = {}
-    for reading in readings:
-        utility_type = reading.utility_type
-        if utility_type not in utility_data:
-            utility_data[utility_type] = {
-                'usage': 0,
-                'benchmark': 100  # Default benchmark
-            }
-        utility_data[utility_type]['usage'] += float(reading.reading_value)
+    now = datetime.now()
+    month = int(request.GET.get('month', now.month))
+    year = int(request.GET.get('year', now.year))
+    
+    # Aggregate usage by utility type in the database instead of looping
+    # over individual rows in Python
+    monthly_stats = list(UtilityReading.objects.monthly_stats(request.user, year, month))
+    utility_data = {
+        stat['utility_type']: {
+            'usage': float(stat['total_usage'] or 0),
+            'benchmark': 100  # Default benchmark
+        }
+        for stat in monthly_stats
+    }
+    readings_count = sum(stat['reading_count'] for stat in monthly_stats)
     
     # Use our custom analyzer
     analyzer = get_analyzer()
     analysis = analyzer.comprehensive_analysis(utility_data)
     
-    # Generate report content
-    report_content = f"""
+    # Generate report content (list + join instead of quadratic +=)
+    report_parts = [f"""
     EGSA Monthly Report - {year}-{month:02d}
-    Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+    Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}
     User: {request.user.get_full_name() or request.user.username}
-    
+
     SUMMARY:
     Total Cost: ${float(analysis['total_cost']):.2f}
-    
+
     EFFICIENCY SCORES:
-    """
-    
-    for utility, score in analysis['efficiency_scores'].items():
-        report_content += f"    {utility.title()}: {score}\n"
-    
-    report_content += f"\n    RECOMMENDATIONS:\n"
-    for rec in analysis['recommendations']:
-        report_content += f"    - {rec}\n"
-    
-    # Store report in S3
-    s3 = AWSManagerFactory.get_s3_manager()
-    file_key = f"user_{request.user.id}_report_{year}_{month:02d}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-    
-    if s3.upload_report(report_content, file_key):
-        # Create report record
-        report = UtilityReport.objects.create(
-            user=request.user,
-            report_name=f"Monthly Report {year}-{month:02d}",
-            report_type="monthly",
-            s3_file_key=file_key
-        )
-        
-        # Send email notification
-        ses = AWSManagerFactory.get_ses_manager()
-        if request.user.email:
-            ses.send_monthly_report_email(request.user.email, {
-                'period': f"{year}-{month:02d}",
-                'total_cost': float(analysis['total_cost']),
-                'average_efficiency': analysis['efficiency_scores'],
-                'cost_trend': 'Current Month'
-            })
-    
+    """]
+
+    report_parts.extend(
+        f"    {utility.title()}: {score}\n"
+        for utility, score in analysis['efficiency_scores'].items()
+    )
+    report_parts.append("\n    RECOMMENDATIONS:\n")
+    report_parts.extend(f"    - {rec}\n" for rec in analysis['recommendations'])
+    report_content = "".join(report_parts)
+    
+    # Store report in S3 and notify by email off the request thread; the
+    # report row is created up front and removed if the upload fails
+    file_key = f"user_{request.user.id}_report_{year}_{month:02d}_{now.strftime('%Y%m%d_%H%M%S')}.txt"
+    report = UtilityReport.objects.create(
+        user=request.user,
+        report_name=f"Monthly Report {year}-{month:02d}",
+        report_type="monthly",
+        s3_file_key=file_key
+    )
+
+    user_email = request.user.email
+    email_data = {
+        'period': f"{year}-{month:02d}",
+        'total_cost': float(analysis['total_cost']),
+        'average_efficiency': analysis['efficiency_scores'],
+        'cost_trend': 'Current Month'
+    }
+
+    def _upload_and_notify(report_id=report.id):
+        if _s3_manager().upload_report(report_content, file_key):
+            if user_email:
+                _ses_manager().send_monthly_report_email(user_email, email_data)
+        else:
+            UtilityReport.objects.filter(id=report_id).delete()
+
+    submit_background(_upload_and_notify)
+
     # Get previous reports
     previous_reports = UtilityReport.objects.filter(user=request.user).order_by('-date_generated')[:10]
     
@@ -340,7 +397,7 @@ def reports(request):
         'year': year,
         'report_content': report_content,
         'previous_reports': previous_reports,
-        'readings_count': readings.count()
+        'readings_count': readings_count
     }
     
     return render(request, 'egsa/reports.html', context)
@@ -350,15 +407,19 @@ def reports(request):
 def download_report(request, report_id):
     """Download report from S3"""
     report = get_object_or_404(UtilityReport, id=report_id, user=request.user)
-    
-    s3 = AWSManagerFactory.get_s3_manager()
-    content = s3.download_report(report.s3_file_key)
-    
-    if content:
-        response = HttpResponse(content, content_type='text/plain')
+
+    s3 = _s3_manager()
+    try:
+        # Stream straight from S3 to the client instead of materializing
+        # the whole report in memory
+        response = StreamingHttpResponse(
+            s3.iter_report(report.s3_file_key),
+            content_type='text/plain'
+        )
         response['Content-Disposition'] = f'attachment; filename="{report.report_name}.txt"'
         return response
-    else:
+    except Exception as e:
+        logger.error(f"Error streaming report from S3: {e}")
         messages.error(request, 'Report not found or error downloading from S3.')
         return redirect('reports')
 
@@ -383,20 +444,24 @@ def profile(request):
         profile.save()
         
         # Log profile update
-        cloudwatch = AWSManagerFactory.get_cloudwatch_manager()
+        cloudwatch = _cloudwatch_manager()
         cloudwatch.log_user_action(request.user.id, 'profile_updated')
         
         messages.success(request, 'Profile updated successfully!')
         return redirect('profile')
     
-    # Get user statistics
-    total_readings = UtilityReading.objects.filter(user=request.user).count()
-    total_cost = UtilityReading.objects.filter(user=request.user).aggregate(
-        total=Sum('cost')
-    )['total'] or Decimal('0')
-    
+    # Get user statistics in a single aggregate query
+    stats = UtilityReading.objects.filter(user=request.user).aggregate(
+        total_readings=Count('id'),
+        total_cost=Sum('cost')
+    )
+    total_readings = stats['total_readings']
+    total_cost = stats['total_cost'] or Decimal('0')
+
     # Get recent activity
-    recent_readings = UtilityReading.objects.filter(user=request.user)[:5]
+    recent_readings = list(UtilityReading.objects.filter(user=request.user).only(
+        'id', 'utility_type', 'reading_value', 'unit', 'cost', 'reading_date', 'location', 'user'
+    )[:5])
     
     context = {
         'profile': profile,
@@ -416,20 +481,24 @@ def api_usage_data(request):
         utility_type = request.GET.get('type', 'electricity')
         
         # Get last 12 months of data
-        readings = UtilityReading.objects.filter(
+        since = datetime.now() - timedelta(days=365)
+        # values_list skips model instantiation entirely; a year of data
+        # comes back as plain (date, value, cost) tuples
+        rows = UtilityReading.objects.filter(
             user=request.user,
             utility_type=utility_type,
-            reading_date__gte=datetime.now() - timedelta(days=365)
-        ).order_by('reading_date')
-        
-        data = []
-        for reading in readings:
-            data.append({
-                'date': reading.reading_date.strftime('%Y-%m-%d'),
-                'value': float(reading.reading_value),
-                'cost': float(reading.cost or 0)
-            })
-        
-        return JsonResponse({'data': data})
+            reading_date__gte=since
+        ).order_by('reading_date').values_list('reading_date', 'reading_value', 'cost')
+
+        data = [
+            {
+                'date': reading_date.strftime('%Y-%m-%d'),
+                'value': float(reading_value),
+                'cost': float(cost or 0)
+            }
+            for reading_date, reading_value, cost in rows
+        ]
+
+        return _json_response({'data': data})
     
-    return JsonResponse({'error': 'Method not allowed'}, status=405)
+    return _json_response({'error': 'Method not allowed'}, status=405)